@@ -0,0 +1,14 @@
+"""Console entry point for ``mcp-fred`` and ``python -m mcp_fred``."""
+
+import asyncio
+
+
+def main():
+    """Run the MCP FRED server over stdio."""
+    from .server import main as serve
+
+    asyncio.run(serve())
+
+
+if __name__ == "__main__":
+    main()
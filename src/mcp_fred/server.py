@@ -5,29 +5,199 @@ Technical interface for macroeconomic data retrieval.
 """
 
 import asyncio
-import json
 import os
+import re
 import sys
-from datetime import datetime
-from typing import Any, Dict, Optional
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-# MCP imports only - keep startup fast
-from mcp.server import Server
-from mcp.server.stdio import stdio_server
-from mcp.types import TextContent, Tool
+try:
+    from orjson import loads as json_loads
+except ImportError:  # optional "fast" extra
+    from json import loads as json_loads
+
+# MCP imports are deferred to build_app()/handlers - keep startup fast
+if TYPE_CHECKING:
+    from mcp.types import TextContent, Tool
 
 # Global client storage (initialized lazily)
 _client = None
 _api_key = None
+_http = None  # shared httpx.AsyncClient, reused across tool calls
+_tools = None  # list[Tool], built on first list_tools call
+
+# In-process TTL cache: key -> (monotonic timestamp, value), LRU ordered
+_cache: "OrderedDict[tuple, tuple[float, Any]]" = OrderedDict()
+_CACHE_MAX_ENTRIES = 512
+
+# series_ids fan-out: per-call cap, and a bound on concurrent FRED fetches
+# shared by all tool calls (FRED allows ~120 requests/minute)
+_MAX_SERIES_PER_CALL = 20
+_fetch_slots = asyncio.Semaphore(4)
+
+# Checked locally so malformed input never costs a FRED round-trip
+_SERIES_RE = re.compile(r"\A[A-Za-z0-9_]{1,64}\Z")
+_DATE_RE = re.compile(r"\A\d{4}-\d{2}-\d{2}\Z")
+
+# get_series_info truncates series notes to this many characters
+_NOTES_MAX_CHARS = 200
+_ELLIPSIS = "..."
+
+# Largest `limit` accepted by FRED's series/observations endpoint
+_FRED_MAX_LIMIT = 100000
+
+# Parquet disk cache: enabled when pyarrow is importable, bounded in size
+_has_pyarrow = None
+_DISK_CACHE_MAX_FILES = 512
+
+_DAY = 24 * 60 * 60
+_OBSERVATIONS_TTL = _DAY
+_METADATA_TTL = 30 * _DAY
+
+# Per-series observation TTLs, bucketed by release cadence
+_SERIES_TTL = {
+    "FEDFUNDS": _DAY,
+    "WALCL": 7 * _DAY,
+    "CPIAUCSL": 30 * _DAY,
+    "UNRATE": 30 * _DAY,
+    "GDP": 90 * _DAY,
+}
+
+
+def _disk_cache_enabled() -> bool:
+    """Whether the optional "parquet" extra (pyarrow) is installed; checked once."""
+    global _has_pyarrow
+    if _has_pyarrow is None:
+        from importlib.util import find_spec
+
+        _has_pyarrow = find_spec("pyarrow") is not None
+    return _has_pyarrow
+
+
+def _disk_cache_dir() -> Path:
+    """Directory holding the Parquet observations cache."""
+    base = os.environ.get("FRED_CACHE_DIR")
+    if not base:
+        xdg = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+        base = os.path.join(xdg, "mcp-fred")
+    return Path(base)
+
+
+def _disk_cache_path(key: tuple) -> Path:
+    """Parquet file for an observations cache key."""
+    _, series_id, start_date, end_date, limit = key
+    # series_id and dates are validated, so they are safe in a file name
+    name = f"{series_id}_{start_date or ''}_{end_date or ''}_{limit}.parquet"
+    return _disk_cache_dir() / name
+
+
+def _disk_cache_get(key: tuple, ttl: float) -> Optional[tuple[float, list]]:
+    """
+    (age in seconds, observations) persisted by a previous session, if
+    younger than ttl. Expired files are deleted; best effort.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    path = _disk_cache_path(key)
+    try:
+        age = max(0.0, time.time() - path.stat().st_mtime)
+        if age >= ttl:
+            path.unlink()
+            return None
+        return age, pq.read_table(path, columns=["date", "value"]).to_pylist()
+    except (OSError, pa.ArrowException):
+        return None
+
+
+def _disk_cache_put(key: tuple, observations: list) -> None:
+    """
+    Persist observations as zstd-compressed Parquet, keeping at most
+    _DISK_CACHE_MAX_FILES files (oldest dropped first); best effort.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    path = _disk_cache_path(key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Unique per process and thread: to_thread writers may share a key
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            pq.write_table(
+                pa.Table.from_pylist(observations), tmp, compression="zstd"
+            )
+            os.replace(tmp, path)
+        finally:
+            # Left behind only if the write or rename failed
+            tmp.unlink(missing_ok=True)
+
+        files = sorted(
+            path.parent.glob("*.parquet"),
+            key=lambda f: f.stat().st_mtime,
+            reverse=True
+        )
+        for stale in files[_DISK_CACHE_MAX_FILES:]:
+            stale.unlink()
+    except (OSError, pa.ArrowException):
+        pass
+
+
+def _is_series_id(value: Any) -> bool:
+    """Whether value looks like a FRED series identifier."""
+    return isinstance(value, str) and _SERIES_RE.match(value) is not None
+
+
+def _is_date(value: Any) -> bool:
+    """Whether value is a YYYY-MM-DD date string."""
+    return isinstance(value, str) and _DATE_RE.match(value) is not None
+
+
+def _cache_get(key: tuple, ttl: float) -> Any:
+    """Return a cached value if present and younger than ttl seconds."""
+    ts, value = _cache.get(key, (0.0, None))
+    if value is None or time.monotonic() - ts >= ttl:
+        return None
+    _cache.move_to_end(key)
+    return value
+
+
+def _cache_put(key: tuple, value: Any, age: float = 0.0) -> None:
+    """
+    Store a value, evicting the least recently used entries past the cap.
+    `age` backdates the entry for values that were already that old.
+    """
+    _cache[key] = (time.monotonic() - age, value)
+    _cache.move_to_end(key)
+    while len(_cache) > _CACHE_MAX_ENTRIES:
+        _cache.popitem(last=False)
 
 
 def get_client():
-    """Lazy initialization of FRED client."""
-    global _client, _api_key
+    """Lazy initialization of FRED client and its HTTP connection pool."""
+    global _client, _api_key, _http
     if _client is None:
         _api_key = os.environ.get("FRED_API_KEY", "")
         if _api_key:
-            _client = FredClient(_api_key)
+            import httpx
+
+            _http = httpx.AsyncClient(
+                timeout=30,
+                # FRED JSON compresses well; brotli decoding comes from httpx[brotli]
+                headers={"Accept-Encoding": "gzip, deflate, br"},
+                transport=httpx.AsyncHTTPTransport(
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_connections=8,
+                        max_keepalive_connections=8
+                    ),
+                    retries=3  # reconnect on connect errors/timeouts
+                )
+            )
+            _client = FredClient(_api_key, _http)
     return _client
 
 
@@ -38,17 +208,24 @@ class FredClient:
     """
 
     BASE_URL = "https://api.stlouisfed.org/fred/series/observations"
+    SERIES_URL = "https://api.stlouisfed.org/fred/series"
 
-    def __init__(self, api_key: str):
-        self.api_key = api_key
+    __slots__ = ("api_key", "_http")
 
-    def get_series(self, series_id: str, params: Optional[Dict] = None) -> list:
+    def __init__(self, api_key: str, http):
+        self.api_key = api_key
+        self._http = http
+
+    async def get_series(
+        self,
+        series_id: str,
+        params: Optional[Dict] = None,
+        limit: Optional[int] = None
+    ) -> list:
         """
         Obtiene observaciones de una serie específica.
-        Lazy import of requests and pandas.
+        Transient FRED failures (429/5xx) are retried with backoff.
         """
-        import requests
-
         query_params = {
             "series_id": series_id,
             "api_key": self.api_key,
@@ -59,38 +236,198 @@ class FredClient:
             query_params.update(params)
 
         try:
-            response = requests.get(self.BASE_URL, params=query_params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            async for attempt in _retrying():
+                with attempt:
+                    return await self._stream_observations(query_params, limit)
 
-            if 'observations' not in data:
-                return []
+        except Exception as e:
+            return [{"error": str(e)}]
 
-            # Return raw observations without pandas
-            observations = []
-            for obs in data['observations']:
+    async def _stream_observations(
+        self,
+        query_params: Dict,
+        limit: Optional[int]
+    ) -> list:
+        """
+        Streams the response through ijson, keeping the first `limit` valid
+        observations in stream order (all of them when limit is None).
+        With sort_order=desc these are the newest ones.
+        """
+        import ijson
+
+        observations = []
+        wanted = limit if limit and limit > 0 else None
+        items = ijson.sendable_list()
+        parser = ijson.items_coro(items, "observations.item")
+
+        append = observations.append
+
+        def collect() -> bool:
+            """Move parsed rows into observations; True once enough are kept."""
+            for obs in items:
+                raw = obs.get('value')
+                # FRED marks missing values with "."; skip them without
+                # paying for a raised-and-caught ValueError per row
+                if raw == "." or raw is None:
+                    continue
                 try:
-                    value = float(obs['value'])
-                    observations.append({
-                        'date': obs['date'],
-                        'value': value
-                    })
+                    value = float(raw)
                 except (ValueError, TypeError):
                     continue
+                append({'date': obs['date'], 'value': value})
+                if wanted is not None and len(observations) >= wanted:
+                    return True
+            del items[:]
+            return False
+
+        async with self._http.stream(
+            "GET", self.BASE_URL, params=query_params
+        ) as response:
+            response.raise_for_status()
+            full = False
+            async for chunk in response.aiter_bytes():
+                # Once enough rows are kept, stop parsing but still drain the
+                # body so the keep-alive connection goes back to the pool
+                if not full:
+                    parser.send(chunk)
+                    full = collect()
+        if not full:
+            parser.close()
+            collect()
+
+        return observations
+
+    async def get_series_info(self, series_id: str) -> Optional[Dict]:
+        """
+        Obtiene los metadatos de una serie.
+        Returns None when FRED does not know the series.
+        """
+        query_params = {
+            "series_id": series_id,
+            "api_key": self.api_key,
+            "file_type": "json"
+        }
 
+        async for attempt in _retrying():
+            with attempt:
+                response = await self._http.get(self.SERIES_URL, params=query_params)
+                response.raise_for_status()
+        data = json_loads(response.content)
+
+        if 'seriess' not in data or not data['seriess']:
+            return None
+
+        return data['seriess'][0]
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Only rate limiting and server errors are worth retrying."""
+    import httpx
+
+    if not isinstance(exc, httpx.HTTPStatusError):
+        return False
+    status = exc.response.status_code
+    return status == 429 or status >= 500
+
+
+def _retrying():
+    """Async retry policy: up to 4 attempts, jittered exponential backoff."""
+    from tenacity import (
+        AsyncRetrying,
+        retry_if_exception,
+        stop_after_attempt,
+        wait_exponential_jitter,
+    )
+
+    return AsyncRetrying(
+        stop=stop_after_attempt(4),
+        wait=wait_exponential_jitter(initial=0.2, max=2.0, jitter=0.2),
+        retry=retry_if_exception(_is_transient),
+        reraise=True
+    )
+
+
+async def _fetch_observations(
+    client: FredClient,
+    series_id: str,
+    start_date: Optional[str],
+    end_date: Optional[str],
+    limit: int
+) -> list:
+    """Observations for one series, served from the TTL cache when fresh."""
+    params = {}
+    if start_date:
+        params["observation_start"] = start_date
+    if end_date:
+        params["observation_end"] = end_date
+    if limit and limit > 0:
+        # Let FRED select the tail, newest first. FRED's limit counts "."
+        # missing-value rows too, so over-fetch and trim after filtering.
+        params["sort_order"] = "desc"
+        params["limit"] = str(min(limit * 2, _FRED_MAX_LIMIT))
+
+    cache_key = ("observations", series_id, start_date, end_date, limit)
+    ttl = _SERIES_TTL.get(series_id, _OBSERVATIONS_TTL)
+    observations = _cache_get(cache_key, ttl)
+    if observations is not None:
+        return observations
+
+    if _disk_cache_enabled():
+        cached = await asyncio.to_thread(_disk_cache_get, cache_key, ttl)
+        if cached is not None:
+            # Keep the file's age so the memory TTL does not restart
+            age, observations = cached
+            _cache_put(cache_key, observations, age)
             return observations
 
-        except Exception as e:
-            return [{"error": str(e)}]
+    async with _fetch_slots:
+        observations = await client.get_series(series_id, params, limit)
+    if observations and "error" not in observations[0]:
+        if "sort_order" in params:
+            observations.reverse()
+        _cache_put(cache_key, observations)
+        if _disk_cache_enabled():
+            await asyncio.to_thread(_disk_cache_put, cache_key, observations)
+
+    return observations
+
+
+_TABLE_HEADER = "date       | value\n-----------+-------\n"
+
+
+def _format_observations(series_id: str, observations: list) -> str:
+    """Render one series as a text table."""
+    if not observations:
+        return (f"No data retrieved for series '{series_id}'. "
+                "Verify series ID validity or connectivity.")
 
+    if "error" in observations[0]:
+        return f"Error: {observations[0]['error']}"
 
-# MCP Server
-app = Server("mcp-fred")
+    # Format output without pandas; join once instead of repeated +=.
+    # Observations are ascending by ISO date, so the period is first/last.
+    parts = [
+        f"Series: {series_id}\n"
+        f"Observations: {len(observations)}\n"
+        f"Period: {observations[0]['date']} to {observations[-1]['date']}\n\n",
+        _TABLE_HEADER,
+    ]
+    parts.extend(f"{obs['date']} | {obs['value']}\n" for obs in observations)
+    return "".join(parts)
 
 
-@app.list_tools()
-async def list_tools() -> list[Tool]:
+async def list_tools() -> "list[Tool]":
     """List available FRED tools."""
+    global _tools
+    if _tools is None:
+        _tools = _build_tools()
+    return _tools
+
+
+def _build_tools() -> "list[Tool]":
+    """Tool definitions; constant, so built once and reused."""
+    from mcp.types import Tool
+
     return [
         Tool(
             name="get_series",
@@ -104,7 +441,15 @@ async def list_tools() -> list[Tool]:
                 "properties": {
                     "series_id": {
                         "type": "string",
-                        "description": "FRED series identifier (e.g., FEDFUNDS, GDP, CPIAUCSL)"
+                        "description": "FRED series identifier (e.g., FEDFUNDS, GDP, CPIAUCSL). "
+                                       "Required unless series_ids is given"
+                    },
+                    "series_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Up to 20 FRED series identifiers to fetch "
+                                       "concurrently; takes precedence over series_id",
+                        "maxItems": 20
                     },
                     "start_date": {
                         "type": "string",
@@ -118,11 +463,11 @@ async def list_tools() -> list[Tool]:
                     },
                     "limit": {
                         "type": "integer",
-                        "description": "Maximum number of observations to return",
+                        "description": "Maximum number of most recent observations "
+                                       "to return; missing values are skipped",
                         "default": 100
                     }
-                },
-                "required": ["series_id"]
+                }
             }
         ),
         Tool(
@@ -143,9 +488,10 @@ async def list_tools() -> list[Tool]:
     ]
 
 
-@app.call_tool()
-async def call_tool(name: str, arguments: Any) -> list[TextContent]:
+async def call_tool(name: str, arguments: Any) -> "list[TextContent]":
     """Execute FRED tools."""
+    from mcp.types import TextContent
+
     client = get_client()
 
     if not client or not _api_key:
@@ -155,80 +501,103 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
         )]
 
     if name == "get_series":
-        series_id = arguments.get("series_id")
-        start_date = arguments.get("start_date")
-        end_date = arguments.get("end_date")
-        limit = arguments.get("limit", 100)
-
-        params = {}
-        if start_date:
-            params["observation_start"] = start_date
-        if end_date:
-            params["observation_end"] = end_date
-
-        observations = client.get_series(series_id, params)
-
-        if not observations:
+        series_ids = arguments.get("series_ids")
+        # Older mcp releases do not validate inputSchema, so check the type
+        # here: a bare string would otherwise be fetched char by char
+        if series_ids is not None and not (
+            isinstance(series_ids, list)
+            and all(isinstance(sid, str) for sid in series_ids)
+        ):
             return [TextContent(
                 type="text",
-                text=f"No data retrieved for series '{series_id}'. "
-                     "Verify series ID validity or connectivity."
+                text="ERROR: series_ids must be a list of strings"
             )]
-
-        if len(observations) > 0 and "error" in observations[0]:
+        if series_ids:
+            series_ids = list(dict.fromkeys(series_ids))
+            if len(series_ids) > _MAX_SERIES_PER_CALL:
+                return [TextContent(
+                    type="text",
+                    text=f"ERROR: at most {_MAX_SERIES_PER_CALL} series_ids per call"
+                )]
+        else:
+            series_ids = [arguments.get("series_id")]
+        if not all(series_ids):
             return [TextContent(
                 type="text",
-                text=f"Error: {observations[0]['error']}"
+                text="ERROR: series_id or series_ids is required"
             )]
+        for series_id in series_ids:
+            if not _is_series_id(series_id):
+                return [TextContent(
+                    type="text",
+                    text=f"ERROR: invalid series_id '{series_id}'"
+                )]
+        start_date = arguments.get("start_date")
+        end_date = arguments.get("end_date")
+        for date in (start_date, end_date):
+            if date and not _is_date(date):
+                return [TextContent(
+                    type="text",
+                    text=f"ERROR: invalid date '{date}', expected YYYY-MM-DD"
+                )]
+        limit = arguments.get("limit", 100)
+
+        # Fan out so several series cost ~one round-trip of wall-clock time
+        results = await asyncio.gather(
+            *[
+                _fetch_observations(client, series_id, start_date, end_date, limit)
+                for series_id in series_ids
+            ],
+            return_exceptions=True
+        )
 
-        # Get last N observations
-        observations = observations[-limit:] if len(observations) > limit else observations
+        blocks = []
+        for series_id, observations in zip(series_ids, results):
+            if isinstance(observations, Exception):
+                observations = [{"error": str(observations)}]
+            blocks.append(_format_observations(series_id, observations))
 
-        # Format output without pandas
-        output = f"Series: {series_id}\n"
-        output += f"Observations: {len(observations)}\n"
-        if observations:
-            dates = [obs['date'] for obs in observations]
-            output += f"Period: {min(dates)} to {max(dates)}\n\n"
-            output += "date       | value\n"
-            output += "-----------+-------\n"
-            for obs in observations:
-                output += f"{obs['date']} | {obs['value']}\n"
+        if len(blocks) == 1:
+            output = blocks[0]
+        else:
+            output = "\n\n".join(block.rstrip("\n") for block in blocks)
 
         return [TextContent(type="text", text=output)]
 
     elif name == "get_series_info":
-        import requests
-
         series_id = arguments.get("series_id")
-
-        url = "https://api.stlouisfed.org/fred/series"
-        params = {
-            "series_id": series_id,
-            "api_key": _api_key,
-            "file_type": "json"
-        }
+        if not _is_series_id(series_id):
+            return [TextContent(
+                type="text",
+                text=f"ERROR: invalid series_id '{series_id}'"
+            )]
 
         try:
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            cache_key = ("series", series_id)
+            series = _cache_get(cache_key, _METADATA_TTL)
+            if series is None:
+                series = await client.get_series_info(series_id)
 
-            if 'seriess' not in data or not data['seriess']:
-                return [TextContent(
-                    type="text",
-                    text=f"Series '{series_id}' not found"
-                )]
+                if series is None:
+                    return [TextContent(
+                        type="text",
+                        text=f"Series '{series_id}' not found"
+                    )]
+
+                _cache_put(cache_key, series)
 
-            series = data['seriess'][0]
-            output = f"Series Information: {series_id}\n"
-            output += f"Title: {series.get('title', 'N/A')}\n"
-            output += f"Frequency: {series.get('frequency', 'N/A')}\n"
-            output += f"Units: {series.get('units', 'N/A')}\n"
-            output += f"Seasonal Adjustment: {series.get('seasonal_adjustment', 'N/A')}\n"
-            output += f"Last Updated: {series.get('last_updated', 'N/A')}\n"
             notes = series.get('notes', 'N/A')
-            output += f"Notes: {notes[:200]}{'...' if len(notes) > 200 else ''}"
+            if len(notes) > _NOTES_MAX_CHARS:
+                notes = notes[:_NOTES_MAX_CHARS] + _ELLIPSIS
+            output = (
+                f"Series Information: {series_id}\n"
+                f"Title: {series.get('title', 'N/A')}\n"
+                f"Frequency: {series.get('frequency', 'N/A')}\n"
+                f"Units: {series.get('units', 'N/A')}\n"
+                f"Seasonal Adjustment: {series.get('seasonal_adjustment', 'N/A')}\n"
+                f"Last Updated: {series.get('last_updated', 'N/A')}\n"
+                f"Notes: {notes}"
+            )
 
             return [TextContent(type="text", text=output)]
 
@@ -241,8 +610,21 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
     return [TextContent(type="text", text=f"Unknown tool: {name}")]
 
 
+def build_app():
+    """Create the MCP server and register the FRED tool handlers."""
+    from mcp.server import Server
+
+    app = Server("mcp-fred")
+    app.list_tools()(list_tools)
+    app.call_tool()(call_tool)
+    return app
+
+
 async def main():
     """Run MCP server."""
+    from mcp.server.stdio import stdio_server
+
+    app = build_app()
     # Use stderr for logging to avoid interfering with stdio protocol
     print("Starting MCP FRED server...", file=sys.stderr)
     async with stdio_server() as (read_stream, write_stream):